@@ -17,3 +17,8 @@ MONTH_MAP = {
 }
 
 BASE_PATH = Path(__file__).parent.parent / "data"
+
+CACHE_PATH = BASE_PATH / ".cache"
+
+# Colunas mínimas que todo snapshot exportado do FM precisa ter
+REQUIRED_COLUMNS = ["Name", "Age", "Club", "Nat", "Highest Role Score"]
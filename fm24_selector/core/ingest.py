@@ -0,0 +1,177 @@
+# fm24_selector/core/ingest.py
+
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from fm24_selector.config import BASE_PATH, REQUIRED_COLUMNS
+from fm24_selector.core.json_handler import (
+    load_prepared_squad,
+    load_snapshot,
+    parse_snapshot_date,
+    squad_cache_file,
+)
+from fm24_selector.utils.cache import file_digest, prune_cache
+
+logger = logging.getLogger(__name__)
+
+
+def find_snapshots(base_path: Path = BASE_PATH) -> list[Path]:
+    """
+    Lista todos os snapshots em data/<team>/*.json.
+    """
+    return sorted(Path(base_path).glob("*/*.json"))
+
+
+def validate_columns(json_path: Path, df: pd.DataFrame) -> None:
+    """
+    Verifica se o snapshot possui as colunas obrigatórias.
+    Levanta ValueError caso contrário.
+    """
+    missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"Snapshot '{json_path}' sem as colunas obrigatórias: {missing}")
+
+
+def is_ingested(digest: str, team: str, threshold: float = 100) -> bool:
+    """
+    Indica se um snapshot (pelo hash) já tem o elenco preparado no cache.
+    """
+    return any(
+        squad_cache_file(digest, team, threshold, national_squad).exists()
+        for national_squad in (False, True)
+    )
+
+
+def ingest_snapshot(
+    json_path: Path,
+    threshold: float = 100,
+    digest: str | None = None
+) -> bool:
+    """
+    Valida o snapshot (nome no padrão do MONTH_MAP e colunas obrigatórias)
+    e pré-computa no cache o elenco preparado do time (pasta do arquivo),
+    tanto por clube quanto por seleção. Nada é gravado se a validação falhar.
+    Retorna False se o conteúdo já estava ingerido.
+    """
+    json_path = Path(json_path)
+    team = json_path.parent.name
+    digest = digest or file_digest(json_path)
+
+    parse_snapshot_date(json_path)
+    if is_ingested(digest, team, threshold):
+        logger.debug("Snapshot %s/%s sem alterações", team, json_path.name)
+        return False
+
+    df = load_snapshot(json_path)
+    validate_columns(json_path, df)
+
+    for national_squad, column in ((False, "Club"), (True, "Nat")):
+        if (df[column] == team).any():
+            load_prepared_squad(json_path, team, threshold, national_squad, digest, df)
+
+    logger.info("Snapshot %s/%s ingerido", team, json_path.name)
+    return True
+
+
+class SnapshotWatcher:
+    """
+    Observa BASE_PATH por snapshots novos ou alterados e os ingere em
+    background. Arquivos cujo hash de conteúdo não mudou são ignorados, e
+    entradas de cache de snapshots que não existem mais são removidas.
+    """
+
+    def __init__(
+        self,
+        base_path: Path = BASE_PATH,
+        threshold: float = 100,
+        workers: int = 2
+    ):
+        self.base_path = Path(base_path)
+        self.threshold = threshold
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._seen: dict[Path, tuple[tuple[int, int], str]] = {}
+        self._pending: dict[Path, Future] = {}
+        self._complete_scan = False
+
+    def changed_snapshots(self) -> list[tuple[Path, str]]:
+        """
+        Retorna (path, digest) dos snapshots cujo conteúdo mudou desde a última
+        varredura. O hash só é recalculado quando mtime/tamanho mudam.
+        """
+        snapshots = find_snapshots(self.base_path)
+        for vanished in set(self._seen) - set(snapshots):
+            self._seen.pop(vanished, None)
+            self._pending.pop(vanished, None)
+
+        changed = []
+        self._complete_scan = True
+        for path in snapshots:
+            previous = self._seen.get(path)
+            try:
+                stat = path.stat()
+                signature = (stat.st_mtime_ns, stat.st_size)
+                if previous and previous[0] == signature:
+                    continue
+                digest = file_digest(path)
+            except OSError as exc:
+                # Renomeado/removido após o glob, ou ainda bloqueado pelo FM
+                logger.warning("Não foi possível ler %s: %s", path, exc)
+                self._seen.pop(path, None)
+                self._complete_scan = False
+                continue
+
+            self._seen[path] = (signature, digest)
+            if previous and previous[1] == digest:
+                continue
+            changed.append((path, digest))
+        return changed
+
+    def poll(self) -> list[Future]:
+        """
+        Faz uma varredura e agenda a ingestão dos snapshots alterados.
+        """
+        known = set(self._seen)
+        changed = self.changed_snapshots()
+        if self._complete_scan and (changed or known - set(self._seen)):
+            # Só limpa o cache quando todos os arquivos foram lidos, para não
+            # descartar entradas de um snapshot temporariamente bloqueado
+            prune_cache({digest for _, digest in self._seen.values()})
+
+        futures = []
+        for path, digest in changed:
+            running = self._pending.get(path)
+            if running is not None and not running.done():
+                # Ainda processando a versão anterior: força nova varredura depois
+                self._seen.pop(path, None)
+                continue
+            future = self._executor.submit(ingest_snapshot, path, self.threshold, digest)
+            future.add_done_callback(lambda f, p=path: self._on_done(p, f))
+            self._pending[path] = future
+            futures.append(future)
+        return futures
+
+    def _on_done(self, path: Path, future: Future) -> None:
+        exc = future.exception()
+        if exc is not None:
+            logger.warning("Falha ao ingerir %s: %s", path, exc)
+
+    def run(self, interval: float = 5.0) -> None:
+        """
+        Loop de observação até Ctrl+C.
+        """
+        logger.info("Observando %s (a cada %.1fs)", self.base_path, interval)
+        try:
+            while True:
+                self.poll()
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            logger.info("Encerrando watcher")
+        finally:
+            self.shutdown()
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
@@ -8,16 +8,26 @@ import pandas as pd
 
 from fm24_selector.config import BASE_PATH, MONTH_MAP
 from fm24_selector.core.processing import apply_threshold_rule, filter_roles_by_position
+from fm24_selector.utils.cache import cache_file, file_digest, read_cache, write_cache
+
+
+def parse_snapshot_date(json_path: Path) -> datetime:
+    """
+    Extrai a data de um snapshot a partir do nome do arquivo (ex: 'jan2025.json').
+    Levanta ValueError se o nome não seguir o padrão <mês><ano> do MONTH_MAP.
+    """
+    stem = Path(json_path).stem
+    month, year = stem[:-4].lower(), stem[-4:]
+    if month not in MONTH_MAP or not year.isdigit():
+        raise ValueError(
+            f"Nome de snapshot inválido: '{Path(json_path).name}' (esperado ex: jan2025.json)"
+        )
+    return datetime(int(year), MONTH_MAP[month], 1)
 
 
 def get_json_path(team, month="latest", year="latest"):
     path = Path(BASE_PATH) / team
-    files = []
-    for f in path.glob("*.json"):
-        stem = f.stem
-        m = MONTH_MAP[stem[:-4].lower()]
-        y = int(stem[-4:])
-        files.append((datetime(y, m, 1), f))
+    files = [(parse_snapshot_date(f), f) for f in path.glob("*.json")]
 
     if month != "latest":
         files = [tup for tup in files if tup[1].stem.lower().startswith(month.lower())]
@@ -28,6 +38,69 @@ def get_json_path(team, month="latest", year="latest"):
     return selected
 
 
+def load_snapshot(json_path: Path) -> pd.DataFrame:
+    """
+    Carrega o JSON completo em um DataFrame.
+    Levanta ValueError se o arquivo não tiver a chave 'data'.
+    """
+    with open(json_path, 'r') as f:
+        payload = json.load(f)
+    if not isinstance(payload, dict) or "data" not in payload:
+        raise ValueError(f"Snapshot '{json_path}' sem a chave 'data'")
+    return pd.DataFrame(payload["data"])
+
+
+def prepare_squad(
+    df: pd.DataFrame,
+    club: str,
+    threshold: float = 0.5,
+    national_squad: bool = False
+) -> pd.DataFrame:
+    """
+    Filtra o clube (ou a seleção, se national_squad) e aplica o threshold.
+    """
+    column = "Nat" if national_squad else "Club"
+    df = df[df[column] == club]
+    return apply_threshold_rule(df, threshold_offset=threshold)
+
+
+def squad_cache_file(
+    digest: str,
+    club: str,
+    threshold: float = 0.5,
+    national_squad: bool = False
+) -> Path:
+    """
+    Caminho do cache do elenco preparado de um snapshot.
+    """
+    column = "Nat" if national_squad else "Club"
+    return cache_file(digest, "squad", column, club, float(threshold))
+
+
+def load_prepared_squad(
+    json_path: Path,
+    club: str,
+    threshold: float = 0.5,
+    national_squad: bool = False,
+    digest: str | None = None,
+    snapshot: pd.DataFrame | None = None
+) -> pd.DataFrame:
+    """
+    Retorna o elenco já filtrado e com threshold aplicado, lendo do cache
+    se o snapshot já foi preparado (ex: pelo watcher de ingestão).
+    `snapshot` evita reler o JSON quando o chamador já o carregou.
+    """
+    digest = digest or file_digest(json_path)
+    cached = squad_cache_file(digest, club, threshold, national_squad)
+    df = read_cache(cached)
+    if df is None:
+        if snapshot is None:
+            snapshot = load_snapshot(json_path)
+        df = prepare_squad(snapshot, club, threshold, national_squad)
+        write_cache(cached, df)
+    return df
+
+
 def load_squad(
     json_path: Path,
     club: str,
@@ -42,18 +115,13 @@ def load_squad(
     """
     players_to_remove = players_to_remove or []
 
-    # 1) ler JSON
-    with open(json_path, 'r') as f:
-        data = json.load(f)["data"]
-    df = pd.DataFrame(data)
-
-    # 2) filtrar clube e remoções
-    df = df.query("Club == @club and Name not in @players_to_remove")
+    # 1) ler JSON (ou cache), filtrar clube e zerar scores abaixo do threshold
+    df = load_prepared_squad(json_path, club, threshold)
 
-    # 3) zerar scores abaixo do threshold
-    df = apply_threshold_rule(df, threshold_offset=threshold)
+    # 2) remoções
+    df = df[~df["Name"].isin(players_to_remove)]
 
-    # 4) se quiser filtrar por posição, zerar roles não permitidas
+    # 3) se quiser filtrar por posição, zerar roles não permitidas
     if use_positions and formation:
         df = filter_roles_by_position(df, list(formation.keys()))
 
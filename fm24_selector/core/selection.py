@@ -1,12 +1,12 @@
 # fm24_selector/core/selection.py
 
-import json
 import math
 
 import pandas as pd
 from pulp import LpMaximize, LpProblem, LpVariable, lpSum, value
 
-from fm24_selector.core.processing import apply_threshold_rule, filter_roles_by_position
+from fm24_selector.core.json_handler import load_prepared_squad
+from fm24_selector.core.processing import filter_roles_by_position
 
 
 def get_best(ratings: pd.DataFrame,
@@ -90,25 +90,17 @@ def get_best_from_json(json_path: str,
     """
     players_to_remove = players_to_remove or []
 
-    # 1) Leitura do JSON e DataFrame
-    with open(json_path, 'r') as f:
-        data = json.load(f)["data"]
-    df = pd.DataFrame(data)
+    # 1) Leitura do JSON (ou cache), filtro de clube e threshold de scores
+    df = load_prepared_squad(json_path, club, threshold, national_squad)
 
-    # 2) Filtra clube e remoções
-    if national_squad:
-        df = df.query("Nat == @club and Name not in @players_to_remove")
-    else:
-        df = df.query("Club == @club and Name not in @players_to_remove")
+    # 2) Remoções
+    df = df[~df["Name"].isin(players_to_remove)]
 
-    # 3) Threshold de scores
-    df = apply_threshold_rule(df, threshold_offset=threshold)
-
-    # 4) Filtrar roles incompatíveis com a posição real
+    # 3) Filtrar roles incompatíveis com a posição real
     if use_positions and formation:
         df = filter_roles_by_position(df, list(formation.keys()))
 
-    # 5) Geração dos 3 melhores times
+    # 4) Geração dos 3 melhores times
     teams = []
     remaining = df.copy()
     for _ in range(3):
@@ -133,22 +125,14 @@ def get_players_for_position(
     Para cada role em formation, lista (Name,Score) ordenados.
     Se `use_positions=True`, zera também as roles incompatíveis com a posição real.
     """
-    # 1) Carrega JSON e filtra clube
-    with open(json_path, 'r') as f:
-        data = json.load(f)["data"]
-    if national_squad:
-        df = pd.DataFrame(data).query("Nat == @club")
-    else:
-        df = pd.DataFrame(data).query("Club == @club")
-
-    # 2) Threshold de scores
-    df = apply_threshold_rule(df, threshold_offset=score_threshold)
-
-    # 3) (Opcional) Filtra roles por posição real
+    # 1) Carrega JSON (ou cache), filtra clube e aplica threshold de scores
+    df = load_prepared_squad(json_path, club, score_threshold, national_squad)
+
+    # 2) (Opcional) Filtra roles por posição real
     if use_positions and formation:
         df = filter_roles_by_position(df, list(formation.keys()))
 
-    # 4) Agrupa por role e retorna lista de (Name,Score)
+    # 3) Agrupa por role e retorna lista de (Name,Score)
     result = {}
     for role in formation:
         df_role = df[df[role] != 0].sort_values(role, ascending=False)
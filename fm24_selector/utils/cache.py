@@ -0,0 +1,84 @@
+# fm24_selector/utils/cache.py
+
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from fm24_selector.config import CACHE_PATH
+
+logger = logging.getLogger(__name__)
+
+# Incrementar sempre que mudar a forma como os DataFrames em cache são
+# construídos (ex: apply_threshold_rule), invalidando entradas antigas
+CACHE_VERSION = 1
+
+
+def file_digest(path: Path, chunk_size: int = 1 << 20) -> str:
+    """
+    Calcula o sha256 do conteúdo do arquivo, lendo em blocos.
+    """
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def cache_file(digest: str, *key) -> Path:
+    """
+    Caminho do cache para um snapshot (pelo hash do conteúdo) e uma chave
+    extra (ex: 'squad', coluna, clube, threshold).
+    """
+    suffix = hashlib.sha1("|".join(map(str, key)).encode()).hexdigest()[:12]
+    return Path(CACHE_PATH) / f"{digest}-v{CACHE_VERSION}-{suffix}.pkl"
+
+
+def read_cache(path: Path) -> pd.DataFrame | None:
+    """
+    Lê um DataFrame do cache. Retorna None se não existir ou não puder ser
+    lido (corrompido, gravado por outra versão do pandas...); nesse caso a
+    entrada é removida para ser recalculada.
+    """
+    try:
+        return pd.read_pickle(path)
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        logger.warning("Cache inválido %s descartado: %s", path, exc)
+        Path(path).unlink(missing_ok=True)
+        return None
+
+
+def write_cache(path: Path, df: pd.DataFrame) -> None:
+    """
+    Grava o DataFrame no cache de forma atômica (arquivo temporário + rename),
+    para que uma consulta nunca leia um arquivo pela metade.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        df.to_pickle(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def prune_cache(digests: set[str]) -> list[Path]:
+    """
+    Remove do cache as entradas cujo hash não corresponde a nenhum
+    snapshot atual, ou que foram gravadas por outra CACHE_VERSION.
+    Retorna os arquivos removidos.
+    """
+    removed = []
+    for path in Path(CACHE_PATH).glob("*.pkl"):
+        digest, _, rest = path.stem.partition("-")
+        if digest not in digests or not rest.startswith(f"v{CACHE_VERSION}-"):
+            path.unlink(missing_ok=True)
+            removed.append(path)
+    return removed
@@ -0,0 +1,36 @@
+# fm24_selector/watch.py
+
+import argparse
+import sys
+
+from fm24_selector.core.ingest import SnapshotWatcher
+from fm24_selector.utils.logging import configure_logging
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='FM24 snapshot ingestion watcher')
+    parser.add_argument('--score-threshold', type=float, default=100,
+                        help='Threshold used to precompute squads (same as the selector)')
+    parser.add_argument('--interval', type=float, default=5.0, help='Seconds between scans')
+    parser.add_argument('--workers', type=int, default=2, help='Background ingestion workers')
+    parser.add_argument('--once', action='store_true',
+                        help='Ingest pending snapshots and exit (non-zero if any failed)')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    configure_logging()
+
+    watcher = SnapshotWatcher(threshold=args.score_threshold, workers=args.workers)
+    if args.once:
+        futures = watcher.poll()
+        watcher.shutdown()
+        if any(f.exception() is not None for f in futures):
+            sys.exit(1)
+    else:
+        watcher.run(args.interval)
+
+
+if __name__ == '__main__':
+    main()
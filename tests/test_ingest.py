@@ -0,0 +1,153 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from fm24_selector.core import ingest
+from fm24_selector.core.ingest import SnapshotWatcher, ingest_snapshot
+from fm24_selector.core.selection import get_best_from_json, get_players_for_position
+from fm24_selector.utils import cache
+
+TEAM = "Santos"
+FORMATION = {"gkd": 1, "cdd": 2}
+
+
+def make_players(n=12, club=TEAM):
+    return [
+        {
+            "Name": f"Player {i}",
+            "Age": 18 + i,
+            "Club": club,
+            "Nat": "BRA",
+            "Position": "GK" if i % 3 == 0 else "D (C)",
+            "Highest Role Score": 10.0 + i,
+            "gkd": float(10 + (i * 7) % 5),
+            "cdd": float(9 + (i * 3) % 6),
+        }
+        for i in range(n)
+    ]
+
+
+def write_snapshot(path, players):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"data": players}))
+    return path
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    path = tmp_path / "data" / ".cache"
+    monkeypatch.setattr(cache, "CACHE_PATH", path)
+    return path
+
+
+@pytest.fixture
+def snapshot(tmp_path, cache_dir):
+    return write_snapshot(tmp_path / "data" / TEAM / "jan2025.json", make_players())
+
+
+def cached_files(cache_dir):
+    return sorted(cache_dir.glob("*.pkl")) if cache_dir.exists() else []
+
+
+def test_ingest_skips_unchanged_content(snapshot, cache_dir):
+    assert ingest_snapshot(snapshot) is True
+    files = cached_files(cache_dir)
+    assert files
+
+    assert ingest_snapshot(snapshot) is False
+    assert cached_files(cache_dir) == files
+
+
+def test_watcher_skips_unchanged_and_reingests_changed(tmp_path, snapshot, cache_dir):
+    watcher = SnapshotWatcher(tmp_path / "data", workers=1)
+    try:
+        first = watcher.poll()
+        assert len(first) == 1
+        assert first[0].result() is True
+        old_files = cached_files(cache_dir)
+
+        # mesmo conteúdo, mtime diferente: não reingere
+        stat = snapshot.stat()
+        os.utime(snapshot, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert watcher.poll() == []
+
+        players = make_players()
+        players[0]["gkd"] = 30.0
+        write_snapshot(snapshot, players)
+        changed = watcher.poll()
+        assert len(changed) == 1
+        assert changed[0].result() is True
+
+        new_files = cached_files(cache_dir)
+        assert new_files and set(new_files).isdisjoint(old_files)
+    finally:
+        watcher.shutdown()
+
+
+def test_watcher_survives_vanished_snapshot(tmp_path, snapshot, cache_dir, monkeypatch):
+    watcher = SnapshotWatcher(tmp_path / "data", workers=1)
+    try:
+        monkeypatch.setattr(ingest, "find_snapshots", lambda base_path: [snapshot.with_name("feb2025.json")])
+        assert watcher.poll() == []
+
+        monkeypatch.undo()
+        monkeypatch.setattr(cache, "CACHE_PATH", cache_dir)
+        assert [f.result() for f in watcher.poll()] == [True]
+
+        snapshot.unlink()
+        assert watcher.poll() == []
+        assert cached_files(cache_dir) == []
+    finally:
+        watcher.shutdown()
+
+
+@pytest.mark.parametrize("name", ["janeiro2025.json", "jan25.json", "foo.json"])
+def test_rejects_bad_snapshot_name(tmp_path, cache_dir, name):
+    path = write_snapshot(tmp_path / "data" / TEAM / name, make_players())
+    with pytest.raises(ValueError):
+        ingest_snapshot(path)
+    assert cached_files(cache_dir) == []
+
+
+def test_rejects_missing_required_columns(tmp_path, cache_dir):
+    players = [{k: v for k, v in p.items() if k != "Nat"} for p in make_players()]
+    path = write_snapshot(tmp_path / "data" / TEAM / "jan2025.json", players)
+    with pytest.raises(ValueError, match="Nat"):
+        ingest_snapshot(path)
+    assert cached_files(cache_dir) == []
+
+
+def test_rejects_missing_data_key(tmp_path, cache_dir):
+    path = tmp_path / "data" / TEAM / "jan2025.json"
+    path.parent.mkdir(parents=True)
+    path.write_text(json.dumps({"players": make_players()}))
+    with pytest.raises(ValueError, match="data"):
+        ingest_snapshot(path)
+    assert cached_files(cache_dir) == []
+
+
+def test_unreadable_cache_entry_is_a_miss(tmp_path, cache_dir):
+    path = cache_dir / "broken.pkl"
+    cache_dir.mkdir(parents=True)
+    path.write_bytes(b"not a pickle")
+    assert cache.read_cache(path) is None
+    assert not path.exists()
+
+
+@pytest.mark.parametrize("use_positions", [False, True])
+def test_results_match_with_and_without_warm_cache(snapshot, cache_dir, use_positions):
+    kwargs = dict(threshold=1.5, use_positions=use_positions)
+
+    cold_players = get_players_for_position(snapshot, TEAM, FORMATION, 1.5, use_positions)
+    cold_teams = get_best_from_json(snapshot, TEAM, FORMATION, ["Player 1"], **kwargs)
+    assert cached_files(cache_dir)
+
+    warm_players = get_players_for_position(snapshot, TEAM, FORMATION, 1.5, use_positions)
+    warm_teams = get_best_from_json(snapshot, TEAM, FORMATION, ["Player 1"], **kwargs)
+
+    assert warm_players == cold_players
+    for cold, warm in zip(cold_teams, warm_teams):
+        pd.testing.assert_frame_equal(cold, warm)
+        assert "Player 1" not in set(warm["name"])